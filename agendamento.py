@@ -2,18 +2,22 @@ import streamlit as st
 from datetime import date, timedelta
 from main_functions import get_stores, create_visit, SEGMENTOS_FIXOS  # Importa suas funções já existentes
 
+COMPRADORES = ("Aldo", "Eduardo", "Henrique", "Jose Duda", "Thiago", "Victor", "Robson", "Outro")
+PROMOTORES = ("Promotor A", "Promotor B", "Promotor C")  # Pode vir do DB depois
+CAMPANHAS = ("Campanha 1", "Campanha 2", "Campanha 3")
+GARANTIAS = ("", "Sim", "Não", "A confirmar")
+
 def page_agendar_visita_loja():
     st.subheader("Agendamento de Visitas - Lojas")
     stores = get_stores()
-    compradores = ["Aldo", "Eduardo", "Henrique", "Jose Duda", "Thiago", "Victor", "Robson", "Outro"]
 
     with st.form("form_loja"):
         lojas_escolhidas = st.multiselect("Lojas", stores["name"].tolist())
         dt = st.date_input("Data", value=date.today() + timedelta(days=1))
-        comprador = st.selectbox("Comprador responsável", compradores)
+        comprador = st.selectbox("Comprador responsável", COMPRADORES)
         fornecedor = st.text_input("Fornecedor")
         segmento = st.selectbox("Segmento", SEGMENTOS_FIXOS)
-        garantia = st.selectbox("Garantia comercial", ["", "Sim", "Não", "A confirmar"])
+        garantia = st.selectbox("Garantia comercial", GARANTIAS)
         info = st.text_area("Informações")
         repetir = st.checkbox("Repetir toda semana (4 semanas)")
 
@@ -23,7 +27,7 @@ def page_agendar_visita_loja():
         if not lojas_escolhidas or not fornecedor:
             st.warning("Preencha todos os campos obrigatórios.")
         else:
-            store_ids = [store["id"] for store in stores if store["name"] in lojas_escolhidas]
+            store_ids = stores.loc[stores["name"].isin(lojas_escolhidas), "id"].tolist()
             create_visit(
                 store_ids=store_ids,
                 visit_date=dt,
@@ -39,14 +43,12 @@ def page_agendar_visita_loja():
 
 def page_agendar_visita_degustacao():
     st.subheader("Agendamento de Degustação / Promotor")
-    promotores = ["Promotor A", "Promotor B", "Promotor C"]  # Pode vir do DB depois
-    campanhas = ["Campanha 1", "Campanha 2", "Campanha 3"]
 
     with st.form("form_degustacao"):
-        promotor = st.selectbox("Promotor responsável", promotores)
+        promotor = st.selectbox("Promotor responsável", PROMOTORES)
         dt = st.date_input("Data", value=date.today() + timedelta(days=1))
         local = st.text_input("Local da Degustação")
-        campanha = st.selectbox("Campanha", campanhas)
+        campanha = st.selectbox("Campanha", CAMPANHAS)
         info = st.text_area("Observações")
         repetir = st.checkbox("Repetir toda semana (4 semanas)")
 